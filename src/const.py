@@ -1,2 +1,11 @@
 NOTIFICATION_PADDING = 10
 SCREEN_HEIGHT_THRESHOLD = 600
+
+# Seconds a `hyprctl clients` result is reused for
+HYPRLAND_CLIENTS_TTL = 0.3
+
+# Notifications kept on screen (or waiting to be shown) at once
+MAX_ACTIVE_NOTIFICATIONS = 50
+
+# Closed notification windows kept hidden for reuse
+WINDOW_POOL_SIZE = 3
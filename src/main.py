@@ -1,20 +1,37 @@
 import asyncio
 import json
+import logging
 import os
 import re
-import subprocess
-
-from const import NOTIFICATION_PADDING, SCREEN_HEIGHT_THRESHOLD
+import time
+from dataclasses import dataclass
+
+from const import (
+    HYPRLAND_CLIENTS_TTL,
+    MAX_ACTIVE_NOTIFICATIONS,
+    NOTIFICATION_PADDING,
+    SCREEN_HEIGHT_THRESHOLD,
+)
 
 # Force Wayland backend BEFORE importing any GTK-related modules
 os.environ["GDK_BACKEND"] = "wayland"
 
 import gi
-from dbus_next.aio import MessageBus
-from dbus_next.service import ServiceInterface, method, signal
+from gi.events import GLibEventLoopPolicy
+from sdbus import (
+    DbusInterfaceCommonAsync,
+    dbus_method_async,
+    dbus_signal_async,
+    request_default_bus_name_async,
+    sd_bus_open_user,
+    set_default_bus,
+)
 
 from noitifcation_parser import NotificationParser
-from notification_window import create_notification_window
+from notification_window import (
+    create_notification_window,
+    release_notification_window,
+)
 
 gi.require_version("Gtk", "3.0")
 gi.require_version("GtkLayerShell", "0.1")
@@ -24,6 +41,31 @@ from gi.repository import (  #  # noqa: E402
     GtkLayerShell,  # type: ignore  # noqa: E402, F821
 )
 
+logger = logging.getLogger(__name__)
+
+# File paths mentioned in editor error notifications
+_FILE_PATH_RE = re.compile(r"([/\w.-]+\.\w+)")
+
+# Known window classes per application name
+_APP_MAPPINGS = {
+    "discord": ("discord", "discordcanary"),
+    "telegram": (
+        "telegram-desktop",
+        "telegramdesktop",
+        "org.telegram.desktop",
+    ),
+    "whatsapp": ("whatsapp-for-linux", "whatsapp", "elecwhat"),
+    "signal": ("signal", "org.signal.signal"),
+    "code": ("code", "code-oss", "visual-studio-code"),
+    "thunderbird": ("thunderbird", "mozilla-thunderbird"),
+    "firefox": ("firefox", "firefox-esr"),
+    "chrome": ("google-chrome", "chromium", "chromium-browser"),
+}
+
+_CLASS_TO_APP = {
+    cls: app for app, classes in _APP_MAPPINGS.items() for cls in classes
+}
+
 
 class ClosedReason:
     expired = 1
@@ -31,25 +73,44 @@ class ClosedReason:
     method = 3
 
 
-class Notifications(ServiceInterface):
+@dataclass(slots=True)
+class ChatInfo:
+    title: str
+    subtitle: str | None
+    body: str
+    app_name: str
+    chat_name: str = ""
+
+
+class Notifications(
+    DbusInterfaceCommonAsync,
+    interface_name="org.freedesktop.Notifications",
+):
     _counter = 0
     _nots = {}
 
     def __init__(self, app):
-        super().__init__("org.freedesktop.Notifications")
+        super().__init__()
         self.app = app
-
-    @method()
-    def GetServerInformation(self) -> "ssss":  # type: ignore # noqa: F821
-        return [
+        # Notify calls still waiting on their image to be decoded
+        self._pending = 0
+        # (fetched_at, clients, clients_by_class) from `hyprctl clients`
+        self._clients_cache: tuple[float, list, dict] | None = None
+        # asyncio only holds weak references to tasks, keep running action
+        # handlers alive until they finish
+        self._action_tasks: set[asyncio.Task] = set()
+
+    @dbus_method_async(result_signature="ssss")
+    async def GetServerInformation(self) -> tuple[str, str, str, str]:
+        return (
             "Nachotifications",  # name
             "ndev51",  # vendor
             "1.0.1",  # version
             "1.0",  # spec_version
-        ]
+        )
 
-    @method()
-    def GetCapabilities(self) -> "as":  # type: ignore  # noqa: F722, F821
+    @dbus_method_async(result_signature="as")
+    async def GetCapabilities(self) -> list[str]:
         return [
             "body",
             "actions",
@@ -62,33 +123,44 @@ class Notifications(ServiceInterface):
             "persistence",
         ]
 
-    @signal()
-    def ActionInvoked(self, id: "u", action_key: "s") -> "us":  # type: ignore # noqa: F821
+    @dbus_signal_async("us")
+    def ActionInvoked(self) -> tuple[int, str]:
         """Signal emitted when an action is invoked"""
-        return [id, action_key]
+        raise NotImplementedError
 
-    @signal()
-    def NotificationClosed(self, id: "u", reason: "u") -> "uu":  # type: ignore # noqa: F821
+    @dbus_signal_async("uu")
+    def NotificationClosed(self) -> tuple[int, int]:
         """Signal emitted when notification is closed"""
-        return [id, reason]
+        raise NotImplementedError
 
-    @method()
-    def Notify(
+    @dbus_method_async(input_signature="susssasa{sv}i", result_signature="u")
+    async def Notify(
         self,
-        app_name: "s",  # type: ignore # noqa: F821
-        replaces_id: "u",  # type: ignore # noqa: F821
-        app_icon: "s",  # type: ignore # noqa: F821
-        summary: "s",  # type: ignore # noqa: F821
-        body: "s",  # type: ignore # noqa: F821
-        actions: "as",  # type: ignore  # noqa: F722, F821
-        hints: "a{sv}",  # type: ignore  # noqa: F722, F821
-        expire_timeout: "i",  # type: ignore # noqa: F821
-    ) -> "u":  # type: ignore # noqa: F821
+        app_name: str,
+        replaces_id: int,
+        app_icon: str,
+        summary: str,
+        body: str,
+        actions: list[str],
+        hints: dict[str, tuple[str, object]],
+        expire_timeout: int,
+    ) -> int:
         """Send a notification"""
         self._counter += 1
+        notification_id = self._counter
+
+        # Backpressure: when notifications arrive faster than we can render
+        # them, drop new ones instead of queueing work we'll never catch up on
+        if self._pending >= MAX_ACTIVE_NOTIFICATIONS:
+            GLib.idle_add(
+                self._emit_notifications_closed,
+                [notification_id],
+                ClosedReason.dismissed,
+            )
+            return notification_id
 
         notification = NotificationParser(
-            self._counter,
+            notification_id,
             app_name,
             replaces_id,
             app_icon,
@@ -96,44 +168,71 @@ class Notifications(ServiceInterface):
             body,
             actions,
             hints,
+            defer_parse=True,
         )
 
+        # Image decoding runs on a worker thread; we resume on the main loop,
+        # so the GTK calls below stay on the GTK thread
+        self._pending += 1
+        try:
+            await notification.parse_async()
+        finally:
+            self._pending -= 1
+
         win = create_notification_window(notification, self._on_action_invoked)
 
-        for notf in list(self._nots.values()):
-            notf.screen_pos = (
-                notf.screen_pos + notf._height + NOTIFICATION_PADDING
-            )
-            if notf.screen_pos < SCREEN_HEIGHT_THRESHOLD:
+        # Lay out the stack in plain Python first, then touch GTK only for
+        # the windows that actually move
+        to_move = []
+        to_close = []
+        for notf in self._nots.values():
+            new_pos = notf.screen_pos + notf._height + NOTIFICATION_PADDING
+            if new_pos < SCREEN_HEIGHT_THRESHOLD:
+                to_move.append((notf, new_pos))
+            else:
+                to_close.append(notf)
+
+        for notf, new_pos in to_move:
+            if new_pos != notf.screen_pos:
+                notf.screen_pos = new_pos
                 GtkLayerShell.set_margin(
                     notf,
                     GtkLayerShell.Edge.TOP,
-                    notf.screen_pos,
+                    new_pos,
                 )
-            else:
-                self._close_window(notf, notf.notification)
 
-        win.show_all()
+        self._nots[notification_id] = win
 
-        self._nots[self._counter] = win
+        # Past the cap, also evict the oldest notifications (_nots keeps
+        # insertion order)
+        excess = len(self._nots) - len(to_close) - MAX_ACTIVE_NOTIFICATIONS
+        for notf in self._nots.values():
+            if excess <= 0:
+                break
+            if notf not in to_close:
+                to_close.append(notf)
+                excess -= 1
+
+        # Drop the overflow only once the new notification is on screen
+        self._close_windows(to_close, ClosedReason.expired)
 
         GLib.timeout_add_seconds(
             notification.expire_timeout / 1000,
             lambda: self._close_window(win, notification),
         )
 
-        return self._counter
+        return notification_id
 
-    @method()
-    def CloseNotification(self, id: "u", by_program: "b"):  # type: ignore # noqa: F821
-        notf_to_delete = self._nots.get(id)
-        if notf_to_delete and by_program is True:
-            del self._nots[id]
+    @dbus_method_async(input_signature="u")
+    async def CloseNotification(self, id: int) -> None:
+        self._close_window_by_id(id, reason=ClosedReason.method)
 
     def _on_action_invoked(self, notification_id: int, action_key: str):
         """Handle action invoked from JavaScript"""
-        print(
-            f"Action invoked: {action_key} for notification {notification_id}"
+        logger.debug(
+            "Action invoked: %s for notification %s",
+            action_key,
+            notification_id,
         )
 
         window = self._nots.get(notification_id)
@@ -142,16 +241,21 @@ class Notifications(ServiceInterface):
 
         notification = window.notification
 
-        self._handle_notification_action(notification, action_key)
+        # Focusing/launching apps shells out, keep it off the dbus/GTK loop
+        task = asyncio.get_event_loop().create_task(
+            self._handle_notification_action(notification, action_key)
+        )
+        self._action_tasks.add(task)
+        task.add_done_callback(self._action_tasks.discard)
 
-        self.ActionInvoked(notification_id, action_key)
+        self.ActionInvoked.emit((notification_id, action_key))
 
         # Close notification after action is invoked
         self._close_window_by_id(
             notification_id, reason=ClosedReason.dismissed
         )
 
-    def _handle_notification_action(
+    async def _handle_notification_action(
         self, notification: NotificationParser, action_key: str
     ):
         """Handle specific actions based on app and action type"""
@@ -165,217 +269,228 @@ class Notifications(ServiceInterface):
                 "whatsapp",
                 "signal",
             ]:
-                self._handle_chat_app_action(notification, action_key)
+                await self._handle_chat_app_action(notification, action_key)
             elif app_name in ["thunderbird", "evolution", "geary"]:
-                self._handle_email_app_action(notification, action_key)
+                await self._handle_email_app_action(notification, action_key)
             elif app_name in ["code", "visual studio code", "vscode"]:
-                self._handle_code_app_action(notification, action_key)
+                await self._handle_code_app_action(notification, action_key)
             else:
                 # Generic app focusing
-                self._focus_application_window(app_name)
+                await self._focus_application_window(app_name)
 
         except Exception as e:
-            print(f"Error handling action for {app_name}: {e}")
+            logger.error("Error handling action for %s: %s", app_name, e)
 
-    def _handle_chat_app_action(
+    async def _handle_chat_app_action(
         self, notification: NotificationParser, action_key: str
     ):
         """Handle chat application actions"""
         app_name = notification.app_name.lower()
 
         # Focus the application window first
-        self._focus_application_window(app_name)
+        await self._focus_application_window(app_name)
 
         # Try to extract chat/channel info from notification content
         if action_key in ["reply", "open", "show"]:
             chat_info = self._extract_chat_info(notification)
 
             if app_name == "discord":
-                self._handle_discord_action(chat_info, action_key)
+                await self._handle_discord_action(chat_info, action_key)
             elif app_name in ["telegram", "whatsapp"]:
-                self._handle_messaging_app_action(
+                await self._handle_messaging_app_action(
                     app_name, chat_info, action_key
                 )
 
-    def _handle_email_app_action(
+    async def _handle_email_app_action(
         self, notification: NotificationParser, action_key: str
     ):
         """Handle email application actions"""
         app_name = notification.app_name.lower()
-        self._focus_application_window(app_name)
+        await self._focus_application_window(app_name)
 
-    def _handle_code_app_action(
+    async def _handle_code_app_action(
         self, notification: NotificationParser, action_key: str
     ):
         """Handle VS Code/editor actions"""
-        self._focus_application_window("code")
+        await self._focus_application_window("code")
 
         # VS Code notifications often contain file paths or build results
         if action_key == "open" and "error" in notification.body.lower():
             # Try to parse file path from error message
-            file_match = re.search(r"([/\w.-]+\.\w+)", notification.body)
+            file_match = _FILE_PATH_RE.search(notification.body)
             if file_match:
                 file_path = file_match.group(1)
-                subprocess.run(["code", "--goto", file_path], check=False)
+                proc = await asyncio.create_subprocess_exec(
+                    "code", "--goto", file_path
+                )
+                await proc.wait()
 
     def _extract_chat_info(self, notification: NotificationParser):
         """Extract chat/channel information from notification"""
-        chat_info = {
-            "title": notification.title,
-            "subtitle": notification.subtitle,
-            "body": notification.body,
-            "app_name": notification.app_name,
-        }
+        chat_info = ChatInfo(
+            title=notification.title,
+            subtitle=notification.subtitle,
+            body=notification.body,
+            app_name=notification.app_name,
+        )
 
         # Try to extract username or channel name
         if notification.subtitle:
-            chat_info["chat_name"] = notification.subtitle.strip()
+            chat_info.chat_name = notification.subtitle.strip()
         elif ":" in notification.title:
-            chat_info["chat_name"] = notification.title.split(":")[0].strip()
+            chat_info.chat_name = notification.title.split(":")[0].strip()
 
         return chat_info
 
-    def _handle_discord_action(self, chat_info: dict, action_key: str):
+    async def _handle_discord_action(
+        self, chat_info: ChatInfo, action_key: str
+    ):
         """Handle Discord-specific actions"""
         if action_key == "reply":
-            chat_name = chat_info.get("chat_name", "")
-            print(f"Opening Discord chat: {chat_name}")
+            chat_name = chat_info.chat_name
+            logger.debug("Opening Discord chat: %s", chat_name)
 
             # Use Discord's quick switcher (Ctrl+K)
-            self._send_hyprland_keys(["CTRL", "K"])
+            await self._send_hyprland_keys(["CTRL", "K"])
 
-    def _handle_messaging_app_action(
-        self, app_name: str, chat_info: dict, action_key: str
+    async def _handle_messaging_app_action(
+        self, app_name: str, chat_info: ChatInfo, action_key: str
     ):
         """Handle messaging app actions"""
-        chat_name = chat_info.get("chat_name", "")
-        print(f"Opening {app_name} chat: {chat_name}")
+        chat_name = chat_info.chat_name
+        logger.debug("Opening %s chat: %s", app_name, chat_name)
 
         if action_key == "reply":
             # Many messaging apps use Ctrl+F to search/find chats
-            self._send_hyprland_keys(["CTRL", "F"])
+            await self._send_hyprland_keys(["CTRL", "F"])
 
-    def _focus_application_window(self, app_name: str):
+    async def _focus_application_window(self, app_name: str):
         """Focus the application window using Hyprland commands"""
         try:
-            # Get list of all windows from Hyprland
-            result = subprocess.run(
-                ["hyprctl", "clients", "-j"],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+            hyprland_clients = await self._get_hyprland_clients()
 
-            if result.returncode == 0:
-                clients = json.loads(result.stdout)
+            if hyprland_clients is not None:
+                clients, clients_by_class = hyprland_clients
 
-                # Find window by class or title
+                # Find window by exact class first, then by class or title
                 target_window = None
-                for client in clients:
-                    window_class = client.get("class", "").lower()
-                    window_title = client.get("title", "").lower()
-
-                    # Match app name to window class or title
-                    if (
-                        app_name in window_class
-                        or app_name in window_title
-                        or self._match_app_to_class(app_name, window_class)
-                    ):
-                        target_window = client
+                for app_class in _APP_MAPPINGS.get(app_name, (app_name,)):
+                    target_window = clients_by_class.get(app_class)
+                    if target_window:
                         break
 
+                if target_window is None:
+                    for client in clients:
+                        window_class = client.get("class", "").lower()
+                        window_title = client.get("title", "").lower()
+
+                        # Match app name to window class or title
+                        if (
+                            app_name in window_class
+                            or app_name in window_title
+                            or self._match_app_to_class(app_name, window_class)
+                        ):
+                            target_window = client
+                            break
+
                 if target_window:
                     # Focus the window using Hyprland
                     window_address = target_window.get("address", "")
                     if window_address:
-                        subprocess.run(
-                            [
-                                "hyprctl",
-                                "dispatch",
-                                "focuswindow",
-                                f"address:{window_address}",
-                            ],
-                            check=False,
+                        proc = await asyncio.create_subprocess_exec(
+                            "hyprctl",
+                            "dispatch",
+                            "focuswindow",
+                            f"address:{window_address}",
                         )
+                        await proc.wait()
                         return True
 
                     # Alternative: focus by class
                     window_class = target_window.get("class", "")
                     if window_class:
-                        subprocess.run(
-                            [
-                                "hyprctl",
-                                "dispatch",
-                                "focuswindow",
-                                f"class:^{window_class}$",
-                            ],
-                            check=False,
+                        proc = await asyncio.create_subprocess_exec(
+                            "hyprctl",
+                            "dispatch",
+                            "focuswindow",
+                            f"class:^{window_class}$",
                         )
+                        await proc.wait()
                         return True
 
-        except (
-            subprocess.CalledProcessError,
-            json.JSONDecodeError,
-            FileNotFoundError,
-        ) as e:
-            print(f"Error focusing window with Hyprland: {e}")
+        except (json.JSONDecodeError, FileNotFoundError) as e:
+            logger.error("Error focusing window with Hyprland: %s", e)
 
         # Fallback: try to launch the application
         try:
-            subprocess.run(
-                [app_name],
-                check=False,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
+            # Don't wait on the launched app, it outlives the action
+            await asyncio.create_subprocess_exec(
+                app_name,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
             )
         except FileNotFoundError:
-            print(f"Could not focus or launch {app_name}")
+            logger.error("Could not focus or launch %s", app_name)
 
         return False
 
+    async def _get_hyprland_clients(self) -> tuple[list, dict] | None:
+        """Get Hyprland clients, reusing a recent result during bursts"""
+        now = time.monotonic()
+        if (
+            self._clients_cache
+            and now - self._clients_cache[0] < HYPRLAND_CLIENTS_TTL
+        ):
+            return self._clients_cache[1], self._clients_cache[2]
+
+        # Get list of all windows from Hyprland
+        proc = await asyncio.create_subprocess_exec(
+            "hyprctl",
+            "clients",
+            "-j",
+            stdout=asyncio.subprocess.PIPE,
+        )
+        out, _ = await proc.communicate()
+        if proc.returncode != 0:
+            return None
+
+        clients = json.loads(out)
+        clients_by_class = {}
+        for client in clients:
+            window_class = client.get("class", "").lower()
+            clients_by_class.setdefault(window_class, client)
+
+        self._clients_cache = (now, clients, clients_by_class)
+        return clients, clients_by_class
+
     def _match_app_to_class(self, app_name: str, window_class: str) -> bool:
         """Match application name to window class with common mappings"""
-        app_mappings = {
-            "discord": ["discord", "discordcanary"],
-            "telegram": [
-                "telegram-desktop",
-                "telegramdesktop",
-                "org.telegram.desktop",
-            ],
-            "whatsapp": ["whatsapp-for-linux", "whatsapp", "elecwhat"],
-            "signal": ["signal", "org.signal.signal"],
-            "code": ["code", "code-oss", "visual-studio-code"],
-            "thunderbird": ["thunderbird", "mozilla-thunderbird"],
-            "firefox": ["firefox", "firefox-esr"],
-            "chrome": ["google-chrome", "chromium", "chromium-browser"],
-        }
-
-        possible_classes = app_mappings.get(app_name, [app_name])
-        return any(cls in window_class for cls in possible_classes)
-
-    def _send_hyprland_keys(self, keys: list):
+        return (
+            _CLASS_TO_APP.get(window_class) == app_name
+            or app_name in window_class
+        )
+
+    async def _send_hyprland_keys(self, keys: list):
         """Send keyboard shortcut using Hyprland dispatcher"""
         try:
             # Small delay to ensure window is focused
-            subprocess.run(["sleep", "0.1"], check=False)
+            await asyncio.sleep(0.1)
 
             # Send key combination using Hyprland
             key_combination = " ".join(keys)
-            subprocess.run(
-                [
-                    "hyprctl",
-                    "dispatch",
-                    "sendshortcut",
-                    key_combination,
-                    "class:^.*$",
-                ],
-                check=False,
+            proc = await asyncio.create_subprocess_exec(
+                "hyprctl",
+                "dispatch",
+                "sendshortcut",
+                key_combination,
+                "class:^.*$",
             )
+            await proc.wait()
 
         except FileNotFoundError:
-            print("Hyprland not available for keyboard shortcuts")
+            logger.error("Hyprland not available for keyboard shortcuts")
         except Exception as e:
-            print(f"Error sending keys via Hyprland: {e}")
+            logger.error("Error sending keys via Hyprland: %s", e)
 
     def _close_window_by_id(
         self, notification_id: int, reason: int = ClosedReason.expired
@@ -383,28 +498,58 @@ class Notifications(ServiceInterface):
         """Close window by notification ID"""
         window = self._nots.get(notification_id)
         if window:
-            window.destroy()
+            release_notification_window(window)
             del self._nots[notification_id]
-            self.NotificationClosed(notification_id, reason)
+            self.NotificationClosed.emit((notification_id, reason))
+
+    def _close_windows(self, windows: list, reason: int):
+        """Close a batch of windows, coalescing their close signals"""
+        closed_ids = []
+        for window in windows:
+            notification_id = window.notification.id
+            release_notification_window(window)
+            if self._nots.pop(notification_id, None) is not None:
+                closed_ids.append(notification_id)
+
+        if len(closed_ids) > 1:
+            GLib.idle_add(self._emit_notifications_closed, closed_ids, reason)
+        elif closed_ids:
+            self.NotificationClosed.emit((closed_ids[0], reason))
+
+    def _emit_notifications_closed(self, ids: list, reason: int) -> bool:
+        """Emit NotificationClosed for every id in the batch"""
+        for notification_id in ids:
+            self.NotificationClosed.emit((notification_id, reason))
+
+        return False  # Don't repeat the idle callback
 
     def _close_window(
         self, window: Gtk.Window, notification: NotificationParser
     ) -> bool:
-        """Close and destroy the window."""
-        window.destroy()
+        """Close the window and hand it back for reuse."""
+        # The window may already be closed, or recycled for a newer
+        # notification, by the time this timeout fires
+        if window.notification is notification:
+            release_notification_window(window)
 
         if notification.id in self._nots:
             del self._nots[notification.id]
-            self.NotificationClosed(notification.id, ClosedReason.expired)
+            self.NotificationClosed.emit(
+                (notification.id, ClosedReason.expired)
+            )
 
         return False  # Don't repeat the timeout
 
 
-async def setup_dbus(app):
-    bus = await MessageBus().connect()
-    notifications = Notifications(app)
-    bus.export("/org/freedesktop/Notifications", notifications)
-    await bus.request_name("org.freedesktop.Notifications")
+async def setup_dbus(notifications: Notifications):
+    notifications.export_to_dbus("/org/freedesktop/Notifications")
+    await request_default_bus_name_async("org.freedesktop.Notifications")
+
+
+def _on_dbus_setup_done(task: asyncio.Task) -> None:
+    """Report a failed export or bus name request."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("D-Bus setup failed: %s", task.exception())
 
 
 def main():
@@ -415,17 +560,18 @@ def main():
 
     app.connect("activate", on_activate)
 
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    # Run asyncio on top of the GLib main loop, so the bus is woken up by
+    # GLib directly instead of being polled from a timer
+    asyncio.set_event_loop_policy(GLibEventLoopPolicy())
+    loop = asyncio.get_event_loop()
 
-    def iterate_asyncio():
-        loop.stop()
-        loop.run_forever()
-        return True
+    set_default_bus(sd_bus_open_user())
 
-    GLib.timeout_add(10, iterate_asyncio)
-
-    loop.create_task(setup_dbus(app))
+    # sdbus only keeps a weak reference to exported objects
+    notifications = Notifications(app)
+    # Held for the same reason, asyncio only weakly references tasks
+    setup_task = loop.create_task(setup_dbus(notifications))
+    setup_task.add_done_callback(_on_dbus_setup_done)
 
     app.run(None)
 
@@ -1,14 +1,200 @@
+import asyncio
 import base64
+import functools
+import hashlib
+import logging
 import os
-from pprint import pprint
+import threading
+from collections import OrderedDict
 
 import gi
 
 gi.require_version("GdkPixbuf", "2.0")
 from gi.repository import GdkPixbuf, GLib  # type: ignore  # noqa: E402, F821
 
+logger = logging.getLogger(__name__)
+
+# Left-to-right mark elecwhat puts between the sender and the message
+_LRM = "\u200e"
+
+# Common icon directories (most apps store icons here)
+_ICON_SEARCH_PATHS = [
+    "/usr/share/pixmaps",  # Direct pixmaps (like Alacritty)
+    "/usr/share/icons/hicolor/48x48/apps",  # Most common size
+    "/usr/share/icons/hicolor/64x64/apps",
+    "/usr/share/icons/hicolor/128x128/apps",
+    "/usr/share/icons/hicolor/256x256/apps",  # Discord is here
+    "/usr/local/share/pixmaps",
+]
+
+_ICON_EXTENSIONS = [".png", ".svg", ".xpm", ".ico"]
+
+# Images are shown at 48x48 max, no point in encoding anything bigger
+_ICON_SIZE = 48
+
+# Encoded image-data PNGs keyed by image geometry and a digest of the
+# pixels, so the raw buffers themselves are never kept alive
+_IMAGE_DATA_CACHE: OrderedDict[tuple, str | None] = OrderedDict()
+_IMAGE_DATA_CACHE_SIZE = 64
+_IMAGE_DATA_CACHE_LOCK = threading.Lock()
+
+# Resolved app icons keyed by (app_name, app_icon), least recently used
+# dropped first
+_APP_ICON_CACHE: OrderedDict[tuple[str, str], str] = OrderedDict()
+_APP_ICON_CACHE_SIZE = 128
+_APP_ICON_CACHE_LOCK = threading.Lock()
+
+# Lowercase icon stem -> icon path for each of _ICON_SEARCH_PATHS, in
+# order, built once on first lookup
+_ICON_INDEX: list[dict[str, str]] | None = None
+# Images are decoded on worker threads, only one of them builds the index
+_ICON_INDEX_LOCK = threading.Lock()
+
+
+def _build_icon_index() -> list[dict[str, str]]:
+    """Index the icon directories once so lookups are plain dict probes."""
+    global _ICON_INDEX
+    if _ICON_INDEX is not None:
+        return _ICON_INDEX
+
+    with _ICON_INDEX_LOCK:
+        # Another thread may have built it while we waited
+        if _ICON_INDEX is None:
+            _ICON_INDEX = _scan_icon_dirs()
+    return _ICON_INDEX
+
+
+def _scan_icon_dirs() -> list[dict[str, str]]:
+    """Map lowercase icon stems to paths, one map per search path."""
+    index: list[dict[str, str]] = []
+    for search_path in _ICON_SEARCH_PATHS:
+        # Within a directory, prefer extensions in _ICON_EXTENSIONS order
+        found: dict[str, tuple[int, str]] = {}
+        try:
+            with os.scandir(search_path) as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext not in _ICON_EXTENSIONS or not entry.is_file():
+                        continue
+                    rank = _ICON_EXTENSIONS.index(ext)
+                    stem = stem.lower()
+                    if stem not in found or rank < found[stem][0]:
+                        found[stem] = (rank, entry.path)
+        except OSError:
+            continue
+
+        index.append({stem: path for stem, (_, path) in found.items()})
+
+    return index
+
+
+@functools.lru_cache(maxsize=128)
+def _icon_file_to_base64(icon_path: str) -> str:
+    """Load an icon file and encode it as a base64 PNG (memoized by path)."""
+    try:
+        pixbuf = GdkPixbuf.Pixbuf.new_from_file(icon_path)
+
+        # Resize to 48x48 max for consistency
+        if pixbuf.get_width() > _ICON_SIZE or pixbuf.get_height() > _ICON_SIZE:
+            pixbuf = pixbuf.scale_simple(
+                _ICON_SIZE, _ICON_SIZE, GdkPixbuf.InterpType.BILINEAR
+            )
+
+        success, buffer = pixbuf.save_to_bufferv("png", [], [])
+        if success:
+            return base64.b64encode(buffer).decode("utf-8")
+    except Exception as e:
+        logger.error("Error loading icon %s: %s", icon_path, e)
+
+    return ""
+
+
+def _image_data_to_base64_png(
+    width: int,
+    height: int,
+    rowstride: int,
+    has_alpha: bool,
+    bits_per_sample: int,
+    data: bytes,
+) -> str | None:
+    """Encode raw image-data pixels as a base64 PNG (memoized by content).
+
+    Apps tend to resend the same avatar for every message, so identical
+    pixel buffers only go through the PNG encoder once.
+    """
+    key = (
+        width,
+        height,
+        rowstride,
+        has_alpha,
+        bits_per_sample,
+        hashlib.blake2b(data, digest_size=16).digest(),
+    )
+    with _IMAGE_DATA_CACHE_LOCK:
+        if key in _IMAGE_DATA_CACHE:
+            _IMAGE_DATA_CACHE.move_to_end(key)
+            return _IMAGE_DATA_CACHE[key]
+
+    encoded = _encode_png(
+        width, height, rowstride, has_alpha, bits_per_sample, data
+    )
+
+    with _IMAGE_DATA_CACHE_LOCK:
+        _IMAGE_DATA_CACHE[key] = encoded
+        while len(_IMAGE_DATA_CACHE) > _IMAGE_DATA_CACHE_SIZE:
+            _IMAGE_DATA_CACHE.popitem(last=False)
+
+    return encoded
+
+
+def _encode_png(
+    width: int,
+    height: int,
+    rowstride: int,
+    has_alpha: bool,
+    bits_per_sample: int,
+    data: bytes,
+) -> str | None:
+    """Encode raw image-data pixels as a base64 PNG."""
+    pixbuf = GdkPixbuf.Pixbuf.new_from_bytes(
+        GLib.Bytes(data),
+        GdkPixbuf.Colorspace.RGB,
+        has_alpha,
+        bits_per_sample,
+        width,
+        height,
+        rowstride,
+    )
+
+    # Avatars often arrive at 256x256, shrink before encoding
+    if width > _ICON_SIZE or height > _ICON_SIZE:
+        pixbuf = pixbuf.scale_simple(
+            _ICON_SIZE, _ICON_SIZE, GdkPixbuf.InterpType.BILINEAR
+        )
+
+    # The PNG only lives as a data URI, favour encode speed over size
+    success, buffer = pixbuf.save_to_bufferv("png", ["compression"], ["1"])
+    if not success:
+        return None
+    return base64.b64encode(buffer).decode("utf-8")
+
 
 class NotificationParser:
+    __slots__ = (
+        "id",
+        "app_name",
+        "replaces_id",
+        "app_icon",
+        "title",
+        "subtitle",
+        "body",
+        "actions",
+        "hints",
+        "expire_timeout",
+        "replaceable",
+        "img",
+    )
+
     def __init__(
         self,
         id: int,
@@ -21,6 +207,7 @@ class NotificationParser:
         hints: dict[str, str],
         replaceable: bool = False,
         expire_timeout: int = 7000,
+        defer_parse: bool = False,
     ):
         self.id = id
         self.app_name = app_name
@@ -33,6 +220,7 @@ class NotificationParser:
         self.hints = hints
         self.expire_timeout = expire_timeout
         self.replaceable = replaceable
+        self.img = ""
 
         # pprint(
         #     {
@@ -49,21 +237,29 @@ class NotificationParser:
         #     depth=1,
         # )
 
-        self.parse()
+        # With defer_parse the caller is expected to await parse_async()
+        if not defer_parse:
+            self.parse()
 
     def parse(self):
         self.parse_image()
         self.parse_content()
 
+    async def parse_async(self):
+        """Parse the notification, decoding images on a worker thread."""
+        self.parse_content()
+        self.img = await asyncio.to_thread(self._decode_image_blocking)
+
     def parse_content(self):
         if self.app_name == "elecwhat":
             self.title = self.title[len(self.app_name) + 3 :]
 
-            if len(self.body.split("\u200e")) > 1:
-                self.subtitle = self.body.split(": ")[0]
-                self.body = self.body.split("\u200e:")[1]
+            sender, sep, message = self.body.partition(f"{_LRM}:")
+            if sep:
+                self.subtitle = sender.partition(":")[0]
+                self.body = message
 
-        if self.app_name in self.title:
+        if self.app_name and self.title.startswith(self.app_name):
             self.title = self.title[len(self.app_name) + 3 :]
 
     def has_image_data(self) -> str:
@@ -76,17 +272,43 @@ class NotificationParser:
 
     def parse_image(self):
         """Parse the image data from the hints."""
+        self.img = self._decode_image_blocking()
+
+    def _decode_image_blocking(self):
+        """Decode the notification image, touches disk and encodes PNGs."""
         if key := self.has_image_data():
             wrapped_data = self.hints.get(key)
             image = self.unwrap_variant(wrapped_data)
 
-            self.img = self.image_data_to_base64_png(image)
-            return
+            return self.image_data_to_base64_png(image)
 
-        self.img = self.search_app_image()
+        return self.search_app_image()
 
     def search_app_image(self):
         """Search for the application icon image using KISS principle."""
+        key = (self.app_name, self.app_icon)
+        # Paths and file:// URIs are mostly one-off (e.g. timestamped
+        # screenshots), caching them would only pile up misses
+        cacheable = not (self.app_icon or "").startswith(("/", "file://"))
+        if cacheable:
+            with _APP_ICON_CACHE_LOCK:
+                if key in _APP_ICON_CACHE:
+                    _APP_ICON_CACHE.move_to_end(key)
+                    return _APP_ICON_CACHE[key]
+
+        img = self._find_app_image()
+
+        if cacheable:
+            with _APP_ICON_CACHE_LOCK:
+                _APP_ICON_CACHE[key] = img
+                while len(_APP_ICON_CACHE) > _APP_ICON_CACHE_SIZE:
+                    _APP_ICON_CACHE.popitem(last=False)
+
+        return img
+
+    def _find_app_image(self):
+        """Look the application icon up in the icon index."""
+
         # Simple approach: check common locations where app icons are stored
         icon_name = self.app_icon or self.app_name or ""
         if not icon_name:
@@ -106,18 +328,6 @@ class NotificationParser:
         if mapped_name:
             icon_name = mapped_name
 
-        # Common icon directories (most apps store icons here)
-        search_paths = [
-            "/usr/share/pixmaps",  # Direct pixmaps (like Alacritty)
-            "/usr/share/icons/hicolor/48x48/apps",  # Most common size
-            "/usr/share/icons/hicolor/64x64/apps",
-            "/usr/share/icons/hicolor/128x128/apps",
-            "/usr/share/icons/hicolor/256x256/apps",  # Discord is here
-            "/usr/local/share/pixmaps",
-        ]
-
-        extensions = [".png", ".svg", ".xpm", ".ico"]
-
         # Try variations of the icon name (including original case and common suffixes)
         name_variations = [
             icon_name,  # lowercase version
@@ -133,52 +343,30 @@ class NotificationParser:
             f"{(self.app_name or self.app_icon or '').lower()}-desktop",
         ]
 
-        # Remove empty strings and duplicates
-        name_variations = list(set(v for v in name_variations if v))
-
-        for search_path in search_paths:
-            if not os.path.exists(search_path):
-                continue
+        # Remove empty strings and duplicates, keeping the most likely first.
+        # The icon index is keyed by lowercase stem, so fold case up front.
+        name_variations = list(
+            dict.fromkeys(v.lower() for v in name_variations if v)
+        )
 
+        # Earlier search paths win, then earlier name variations
+        for dir_index in _build_icon_index():
             for name in name_variations:
-                for ext in extensions:
-                    icon_path = os.path.join(search_path, f"{name}{ext}")
-                    if os.path.isfile(icon_path):
-                        return self._convert_icon_to_base64(icon_path)
+                icon_path = dir_index.get(name)
+                if icon_path:
+                    return self._convert_icon_to_base64(icon_path)
 
         # If nothing found, return empty
         return ""
 
     def _convert_icon_to_base64(self, icon_path):
         """Convert icon file to base64 PNG."""
-        try:
-            pixbuf = GdkPixbuf.Pixbuf.new_from_file(icon_path)
-
-            # Resize to 48x48 max for consistency
-            if pixbuf.get_width() > 48 or pixbuf.get_height() > 48:
-                pixbuf = pixbuf.scale_simple(
-                    48, 48, GdkPixbuf.InterpType.BILINEAR
-                )
-
-            success, buffer = pixbuf.save_to_bufferv("png", [], [])
-            if success:
-                return base64.b64encode(buffer).decode("utf-8")
-        except Exception as e:
-            print(f"Error loading icon {icon_path}: {e}")
-
-        return ""
+        return _icon_file_to_base64(os.path.abspath(icon_path))
 
     def unwrap_variant(self, value):
-        """Recursively unwrap dbus_next Variants to Python types."""
-        from dbus_next import Variant
-
-        if isinstance(value, Variant):
-            return self.unwrap_variant(value.value)
-        elif isinstance(value, dict):
-            return {k: self.unwrap_variant(v) for k, v in value.items()}
-        elif isinstance(value, (list, tuple)):
-            return type(value)(self.unwrap_variant(v) for v in value)
-        return value
+        """Unwrap an sdbus variant, a (signature, value) tuple."""
+        _, unwrapped = value
+        return unwrapped
 
     def image_data_to_base64_png(self, image_data):
         (
@@ -191,17 +379,11 @@ class NotificationParser:
             data,
         ) = image_data
 
-        pixbuf = GdkPixbuf.Pixbuf.new_from_bytes(
-            GLib.Bytes(data),
-            GdkPixbuf.Colorspace.RGB,
-            has_alpha,
-            bits_per_sample,
+        return _image_data_to_base64_png(
             width,
             height,
             rowstride,
+            has_alpha,
+            bits_per_sample,
+            bytes(data),
         )
-
-        success, buffer = pixbuf.save_to_bufferv("png", [], [])
-        if not success:
-            return None
-        return base64.b64encode(buffer).decode("utf-8")
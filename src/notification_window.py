@@ -1,7 +1,10 @@
 import json
+import logging
 import os
+import pathlib
+from collections import deque
 
-from const import NOTIFICATION_PADDING
+from const import NOTIFICATION_PADDING, WINDOW_POOL_SIZE
 
 os.environ["GDK_BACKEND"] = "wayland"
 
@@ -21,6 +24,41 @@ from gi.repository import (  # noqa: E402
     WebKit2,  # type: ignore  # noqa: E402
 )
 
+logger = logging.getLogger(__name__)
+
+# NOTIFD_DEV=1 enables the web inspector, it stays off otherwise
+_DEV = os.environ.get("NOTIFD_DEV") == "1"
+
+# Static page loaded once per webview, notifications go in through render()
+_TEMPLATE_PATH = (
+    pathlib.Path(__file__).resolve().parent.parent
+    / "templates"
+    / "notification.html"
+)
+_TEMPLATE_URI = _TEMPLATE_PATH.as_uri()
+
+# Navigations the webview may follow, besides data: URIs
+_ALLOWED_URIS = frozenset({_TEMPLATE_URI, "file:///", ""})
+
+# Parsed once and shared by every webview
+try:
+    _TRANSPARENT = Gdk.RGBA()
+    _TRANSPARENT.parse("rgba(0, 0, 0, 0)")
+except Exception:
+    _TRANSPARENT = None
+
+# One settings object shared by every webview
+_SETTINGS = WebKit2.Settings(
+    enable_javascript=True,
+    javascript_can_open_windows_automatically=False,
+    enable_back_forward_navigation_gestures=False,
+    enable_developer_extras=_DEV,
+    enable_hyperlink_auditing=False,
+)
+
+# Hidden windows kept for reuse, each one saves spawning a WebKit process
+_window_pool: deque = deque()
+
 
 def create_notification_window(
     notification: NotificationParser,
@@ -36,35 +74,73 @@ def create_notification_window(
     Returns:
         Gtk.Window: Configured notification window
     """
-    window = Gtk.Window()
-    window.notification = notification
-    window.action_callback = action_callback
+    if _window_pool:
+        window = _window_pool.pop()
+    else:
+        window = Gtk.Window()
+
+        GtkLayerShell.init_for_window(window)
 
-    GtkLayerShell.init_for_window(window)
+        _set_window_conf(window)
 
-    _set_window_conf(window)
+        webview = _create_webview(window)
 
-    webview = _create_webview(notification, window)
+        window.add(webview)
 
-    window.add(webview)
+        window._webview = webview
+        window._resize_handler = None
+
+        webview.connect(
+            "load-changed",
+            lambda _, event: _on_content_loaded(window, webview, event),
+        )
+
+    window.notification = notification
+    window.action_callback = action_callback
 
     window._width = 320
     window._height = 100
-    window._webview = webview
 
-    webview.connect(
-        "load-changed",
-        lambda _, event: _on_content_loaded(window, webview, event),
-    )
+    # Pooled pages are already loaded, the new content goes in before the
+    # window is shown again
+    rendered = _render_notification(window)
 
     _setup_layer_shell_properties(window)
 
     window.show_all()
     window.present()
 
+    # Measured once shown, so the resize can hook the window's frame clock
+    if rendered:
+        _schedule_resize(window)
+
     return window
 
 
+def release_notification_window(window: Gtk.Window) -> None:
+    """Hide a closed notification window and keep it around for reuse."""
+    window.notification = None
+    window.action_callback = None
+
+    if len(_window_pool) >= WINDOW_POOL_SIZE:
+        window.destroy()
+        return
+
+    webview = window._webview
+    if window._resize_handler is not None:
+        window.get_frame_clock().disconnect(window._resize_handler)
+        window._resize_handler = None
+
+    # Don't keep the old notification around for the next one to flash
+    if webview._page_loaded:
+        webview.run_javascript("clear()", None, None, None)
+
+    window.hide()
+    window.set_size_request(320, 68)
+    webview.set_size_request(-1, -1)
+    _window_pool.append(window)
+
+
 def _setup_layer_shell_properties(
     window: Gtk.Window, screen_pos: int = NOTIFICATION_PADDING
 ) -> None:
@@ -85,11 +161,8 @@ def _setup_layer_shell_properties(
 
         GtkLayerShell.auto_exclusive_zone_enable(window)
 
-    except Exception as e:
-        print(f"✗ Layer shell property setup failed: {e}")
-        import traceback
-
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Layer shell property setup failed")
 
 
 def _set_window_conf(window: Gtk.Window) -> None:
@@ -114,16 +187,10 @@ def _set_window_conf(window: Gtk.Window) -> None:
         window.set_visual(visual)
 
 
-def _create_webview(
-    notification: NotificationParser, window: Gtk.Window
-) -> WebKit2.WebView:
+def _create_webview(window: Gtk.Window) -> WebKit2.WebView:
     """Create and configure the WebKit webview."""
-    webview = WebKit2.WebView()
+    webview = WebKit2.WebView.new_with_settings(_SETTINGS)
     webview.set_name("notification-webview")
-    webview.get_settings().set_enable_javascript(True)
-    webview.get_settings().set_javascript_can_open_windows_automatically(False)
-    webview.get_settings().set_enable_back_forward_navigation_gestures(False)
-    webview.get_settings().set_enable_developer_extras(True)
 
     webview.set_size_request(-1, -1)
     webview.set_editable(False)
@@ -132,153 +199,138 @@ def _create_webview(
     webview.connect("decide-policy", _on_decide_policy)
 
     # Set transparent background
-    try:
-        rgba = Gdk.RGBA()
-        rgba.parse("rgba(0, 0, 0, 0)")
-        webview.set_background_color(rgba)
-    except Exception:
-        pass
-
-    # Prepare actions data for JavaScript with proper escaping
-    actions_data = _prepare_actions_data(notification.actions)
-    actions_json = json.dumps(actions_data) if actions_data else "[]"
-
-    # Helper function to escape strings for HTML/JS
-    def escape_for_html(text):
-        if not text:
-            return ""
-        return (
-            text.replace("\\", "\\\\")
-            .replace('"', '\\"')
-            .replace("'", "\\'")
-            .replace("\n", "\\n")
-            .replace("\r", "\\r")
-        )
+    if _TRANSPARENT is not None:
+        webview.set_background_color(_TRANSPARENT)
 
-    # Load notification content with proper escaping
-    html = (
-        open("templates/notification.html", "r", encoding="utf-8")
-        .read()
-        .replace("{title}", escape_for_html(notification.title))
-        .replace("{body}", escape_for_html(notification.body))
-        .replace("{subtitle}", escape_for_html(notification.subtitle or ""))
-        .replace("{img}", notification.img or "")
-        .replace("{app_name}", escape_for_html(notification.app_name or ""))
-        .replace("{actions}", actions_json)
-        .replace("{notification_id}", str(notification.id))
-    )
-    webview.load_html(html, "file:///")
-
-    # Set up JavaScript message handling for actions
+    # Set up JavaScript message handling, actions and content dimensions
+    # share a single channel
     user_content_manager = webview.get_user_content_manager()
     user_content_manager.connect(
-        "script-message-received::action",
-        lambda _, message: _handle_action_message(window, message),
+        "script-message-received::bridge",
+        lambda _, message: _handle_bridge_message(window, message),
     )
-    user_content_manager.register_script_message_handler("action")
+    user_content_manager.register_script_message_handler("bridge")
 
-    # Show inspector for debugging (comment out for production)
+    # Show inspector for debugging (needs NOTIFD_DEV=1)
     # inspector = webview.get_inspector()
     # inspector.show()
 
+    webview._page_loaded = False
+    webview.load_uri(_TEMPLATE_URI)
+
     return webview
 
 
+def _render_notification(window: Gtk.Window) -> bool:
+    """Push the window's notification into the page, False if not loaded."""
+    webview = window._webview
+    notification = window.notification
+
+    # Fresh webviews render once the page finishes loading
+    if notification is None or not webview._page_loaded:
+        return False
+
+    data = {
+        "title": notification.title or "",
+        "body": notification.body or "",
+        "subtitle": notification.subtitle or "",
+        "img": notification.img or "",
+        "app_name": notification.app_name or "",
+        "actions": _prepare_actions_data(notification.actions),
+        "id": notification.id,
+    }
+    webview.run_javascript(f"render({json.dumps(data)})", None, None, None)
+    return True
+
+
+def _schedule_resize(window: Gtk.Window) -> None:
+    """Measure the content right after the window's next frame is painted."""
+    # Scripts run in order, so a pending measurement already covers the
+    # latest render
+    if window._resize_handler is not None:
+        return
+
+    clock = window.get_frame_clock()
+    if clock is None:
+        _auto_resize_window(window)
+        return
+
+    def on_after_paint(clock):
+        clock.disconnect(window._resize_handler)
+        window._resize_handler = None
+        _auto_resize_window(window)
+
+    window._resize_handler = clock.connect("after-paint", on_after_paint)
+    clock.request_phase(Gdk.FrameClockPhase.AFTER_PAINT)
+
+
 def _prepare_actions_data(actions):
     """Convert actions array to structured data for JavaScript."""
-    if not actions:
-        return []
+    # Actions come in pairs: action_key, action_label. A dangling key
+    # without a label is dropped by zip.
+    return [
+        {"key": key, "label": label}
+        for key, label in zip(actions[0::2], actions[1::2])
+    ]
 
-    action_buttons = []
-    # Actions come in pairs: action_key, action_label
-    for i in range(0, len(actions), 2):
-        if i + 1 < len(actions):
-            action_key = actions[i]
-            action_label = actions[i + 1]
-            action_buttons.append({"key": action_key, "label": action_label})
 
-    return action_buttons
+def _handle_bridge_message(window: Gtk.Window, message) -> None:
+    """Dispatch a {type, payload} message posted by the page."""
+    try:
+        # WebKit2 4.1 hands over a JavascriptResult wrapping a JSCValue
+        data = json.loads(message.get_js_value().to_string())
+        message_type = data["type"]
+        payload = data.get("payload")
+    except Exception as e:
+        logger.error("Error reading bridge message: %s", e)
+        return
+
+    if message_type == "action":
+        _handle_action_message(window, payload)
+    elif message_type == "resize":
+        _handle_resize_message(window, payload)
+    else:
+        logger.warning("Unknown bridge message type: %s", message_type)
 
 
-def _handle_action_message(window: Gtk.Window, message):
+def _handle_action_message(window: Gtk.Window, action_key: str) -> None:
     """Handle action messages from JavaScript."""
     try:
-        # Get the message body (action key)
-        js_value = message.get_js_value()
-        action_key = (
-            js_value.to_string()
-            if hasattr(js_value, "to_string")
-            else str(js_value)
-        )
-
         # Call the action callback if available
-        if window.action_callback and hasattr(window, "notification"):
+        if window.action_callback and window.notification is not None:
             window.action_callback(window.notification.id, action_key)
 
     except Exception as e:
-        print(f"Error handling action message: {e}")
+        logger.error("Error handling action message: %s", e)
 
 
 def _on_content_loaded(
     window: Gtk.Window, webview: WebKit2.WebView, load_event
 ) -> None:
-    """Auto-resize window when WebView content is fully loaded."""
+    """Render the pending notification once the page has loaded."""
     if load_event == WebKit2.LoadEvent.FINISHED:
-        GLib.timeout_add(100, lambda: _auto_resize_window(window))
+        webview._page_loaded = True
+        if _render_notification(window):
+            _schedule_resize(window)
 
 
-def _auto_resize_window(window: Gtk.Window) -> bool:
+def _auto_resize_window(window: Gtk.Window) -> None:
     """Resize window to fit WebView content using JavaScript to get DOM size."""
     webview = window._webview
 
-    # JavaScript to get both width and height of the actual rendered content
-    js_code = """
-    (function() {
-        // Force layout to ensure measurements are accurate
-        document.body.offsetHeight;
-        document.body.offsetWidth;
-
-        // Get the actual bounding box of the body element
-        var bodyRect = document.body.getBoundingClientRect();
-
-        // Return both dimensions as JSON string
-        return JSON.stringify({
-            width: Math.ceil(bodyRect.width),
-            height: Math.ceil(bodyRect.height)
-        });
-    })();
-    """
+    # __resize() is defined by the page and posts the dimensions back
+    # through the bridge, nothing to wait for here
+    webview.run_javascript("__resize()", None, None, None)
 
-    webview.run_javascript(
-        js_code,
-        None,
-        lambda _, result, data: _on_js_dimensions_result(
-            window, webview, result, data
-        ),
-        None,
-    )
-    return False  # Don't repeat
 
+def _handle_resize_message(window: Gtk.Window, dimensions: dict) -> None:
+    """Handle the content dimensions posted by the page."""
+    # Posted just before the window went back to the pool
+    if window.notification is None:
+        return
 
-def _on_js_dimensions_result(
-    window: Gtk.Window, webview: WebKit2.WebView, result, user_data
-) -> None:
-    """Handle the JavaScript result with actual content dimensions."""
+    webview = window._webview
     try:
-        js_result = webview.run_javascript_finish(result)
-
-        if hasattr(js_result, "get_js_value"):
-            js_value = js_result.get_js_value()
-            if hasattr(js_value, "to_string"):
-                dimensions_str = js_value.to_string()
-            elif hasattr(js_value, "get_string"):
-                dimensions_str = js_value.get_string()
-            else:
-                dimensions_str = str(js_value)
-        else:
-            dimensions_str = str(js_result)
-
-        dimensions = json.loads(dimensions_str.strip())
         content_width = dimensions["width"]
         content_height = dimensions["height"]
 
@@ -293,19 +345,11 @@ def _on_js_dimensions_result(
         window._width = new_width + 2
         window._height = new_height + 2
 
-        # print(window._width, window._height)
-
-        # window.resize(window._width, window._height)
-        window.set_size_request(window._width, window._height)
-        webview.set_size_request(window._width, window._height)
-
-        window.show_all()
+        # The window is already shown, just apply both writes in one frame
+        GLib.idle_add(_apply_window_size, window, webview)
 
-    except Exception as e:
-        print(f"Error getting content dimensions: {e}")
-        import traceback
-
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error getting content dimensions")
         # Fallback to reasonable defaults
         fallback_width = 320
         fallback_height = 80
@@ -315,18 +359,26 @@ def _on_js_dimensions_result(
         webview.set_size_request(fallback_width, fallback_height)
 
 
+def _apply_window_size(window: Gtk.Window, webview: WebKit2.WebView) -> bool:
+    """Apply the measured content size to the window and its WebView."""
+    if window.notification is None:
+        return False
+
+    window.set_size_request(window._width, window._height)
+    webview.set_size_request(window._width, window._height)
+    return False  # Don't repeat
+
+
 def _on_decide_policy(
     webview: WebKit2.WebView, decision, decision_type
 ) -> None:
     """Handle WebView navigation policy decisions."""
-    if decision_type == WebKit2.PolicyDecisionType.NAVIGATION_ACTION:
-        navigation_action = decision.get_navigation_action()
-        request = navigation_action.get_request()
-        uri = request.get_uri()
-
-        if uri in ("file:///", "") or uri.startswith("data:"):
-            decision.use()
-        else:
-            decision.ignore()
+    if decision_type != WebKit2.PolicyDecisionType.NAVIGATION_ACTION:
+        decision.use()
         return
-    decision.use()
+
+    uri = decision.get_navigation_action().get_request().get_uri()
+    if uri in _ALLOWED_URIS or uri.startswith("data:"):
+        decision.use()
+    else:
+        decision.ignore()